@@ -0,0 +1,372 @@
+# src/capacity_core.py
+
+# External Library Imports
+import numpy as np
+import math
+from numba import njit
+
+# Bilayer case codes (integer codes keep the dispatch inside Numba's nopython mode)
+CASE_CLAY_ON_CLAY = 0   # case1
+CASE_C_PHI = 1          # case2: c-phi on c-phi (weighted average)
+CASE_SAND_ON_CLAY = 2   # case3_a
+CASE_CLAY_ON_SAND = 3   # case3_b
+
+"===================================================================="
+
+@njit(cache=True)
+def _bearing_factors(fi: float) -> tuple:
+    """
+    Friction-angle-dependent factors of Meyerhof's method (1963).
+
+    Args:
+        fi (float): Friction angle [degrees].
+
+    Returns:
+        tuple: (tan_alpha, Kp, Nq, Nc, Ny, tan_fi) (the get_stratum_factors row layout), 
+               where alpha = 45 + fi/2 and Kp = tan²(alpha).
+    """
+    # Convert the friction angle to radians once. alpha keeps its degree form: tan(alpha) 
+    # drives Nq - 1 ~ 0 for clays (fi = epsilon), where a 1-ulp change shifts Nc by ~0.5%
+    fi_rad = math.radians(fi)
+
+    tan_alpha = math.tan(math.radians(45 + (fi / 2)))
+    kp = tan_alpha * tan_alpha # Coefficient of passive earth pressure
+    tan_fi = math.tan(fi_rad)
+
+    # Bearing Capacity Factors (Nc, Nq, N_gamma)
+    Nq = (math.exp(math.pi * tan_fi)) * kp
+    Nc = (Nq - 1) / tan_fi
+    Ny = (Nq - 1) * math.tan(1.4 * fi_rad)
+
+    return tan_alpha, kp, Nq, Nc, Ny, tan_fi
+
+"===================================================================="
+
+@njit(cache=True)
+def _inclination_factor_gamma(Theta: float, fi: float) -> float:
+    """
+    Inclination factor i_gamma = (1 - Theta/fi)² for fi > 0; for fi <= 0 it is 
+    0 under an inclined load and 1 under a vertical one. Written without branches 
+    (the selections compile to conditional moves).
+
+    Args:
+        Theta (float): Load inclination angle [degrees].
+        fi (float): Friction angle [degrees].
+
+    Returns:
+        float: i_gamma.
+    """
+    is_frictional = fi > 0
+    fi_safe = fi if is_frictional else 1.0 # Avoids the division by zero when fi <= 0
+    
+    return is_frictional * (1 - (Theta / fi_safe)) ** 2 + (not is_frictional) * (Theta <= 0)
+
+"===================================================================="
+
+@njit(cache=True)
+def _safe_divide(a: float, b: float, fallback: float) -> float:
+    """
+    a / b, or fallback when b == 0 (selected without raising ZeroDivisionError).
+
+    Args:
+        a (float): Numerator.
+        b (float): Denominator.
+        fallback (float): Value returned when the denominator is zero.
+
+    Returns:
+        float: The exact quotient for any non-zero b.
+    """
+    return a / b if b != 0 else fallback
+
+"===================================================================="
+
+@njit(cache=True)
+def _meyerhof_core(c1: float, fi1: float, f1: np.ndarray, c2: float, fi2: float, f2: np.ndarray, 
+                   q_bar: float, y_bar: float, d1: float, Df: float, B: float, L: float, 
+                   Theta: float, epsilon: float) -> tuple:
+    """
+    JIT-compiled numeric core of meyerhof_capacity for a single footing.
+
+    It takes the stratum parameters already resolved by the caller (no pandas
+    access), so it can be compiled in Numba's nopython mode.
+
+    Args:
+        c1, fi1 (float): Cohesion [kPa] and friction angle [degrees] of the embedment layer.
+        f1 (np.ndarray): Factors of the embedment layer, a get_stratum_factors row 
+            (Tan Alpha, Kp, Nq, Nc, Ny, Tan Friction Angle).
+        c2, fi2 (float): Cohesion [kPa] and friction angle [degrees] of the layer below.
+        f2 (np.ndarray): Precomputed factors of the layer below (same layout as f1).
+        q_bar, y_bar (float): Effective overburden [kPa] and effective unit weight [kN/m³].
+        d1 (float): Distance from the foundation base to the end of stratum 1 [m].
+        Df, B, L (float): Embedment depth, footing width and footing length [m].
+        Theta (float): Load inclination angle [degrees].
+        epsilon (float): Tolerance used to classify clays (fi < epsilon) and sands (c < epsilon).
+
+    Returns:
+        tuple: (q_ult_single_layer, q_ult_bilayer) [kPa].
+    """
+
+    # Determine influence depth (H) based on fi1 (alpha = 45 + fi1/2)
+    H = (B / 2) * f1[0] # Influence depth for layer interaction
+    kp = f1[1] # Coefficient of passive earth pressure
+
+    # **************************************************************************************************
+    # Calculate Capacity Factors and Correction Factors for Layer 1
+    # **************************************************************************************************
+
+    # Bearing Capacity Factors (Nc, Nq, N_gamma), precomputed per stratum
+    Nq = f1[2]
+    Nc = f1[3]
+    Ny = f1[4]
+
+    # Subexpressions shared by the shape, depth and inclination factors of every layer
+    B_L = B / L
+    Df_B = Df / B
+    theta_term = (1 - (Theta / 90)) ** 2
+    sqrt_kp = math.sqrt(kp)
+
+    # Shape Factors (Sc, Sq, S_gamma)
+    Sc = 1 + (0.2 * kp * B_L)
+    Sq = 1 + 0.1 * kp * B_L * (fi1 > 10) # Only applies for fi1 > 10 (branchless)
+    Sy = Sq
+
+    # Depth Factors (dc, dq, d_gamma)
+    dc = 1 + 0.2 * sqrt_kp * Df_B
+    dq = 1 + 0.1 * sqrt_kp * Df_B * (fi1 > 10)
+    dy = dq
+
+    # Inclination Factors (ic, iq, i_gamma)
+    ic = theta_term
+    iq = ic
+    iy = _inclination_factor_gamma(Theta, fi1)
+
+    # Ultimate Capacity of the single embedment layer (q_ult_1)
+    q_ult_1 = (c1 * Nc * Sc * dc * ic) + (q_bar * Nq * Sq * dq * iq) + (0.5 * y_bar * B * Ny * Sy * dy * iy)
+
+    # Default is the single layer capacity
+    q_ult_bilayer = q_ult_1
+
+    if d1 >= H:
+        # Case A: Influence depth (H) is within the first layer. The single layer result controls.
+        return q_ult_1, q_ult_bilayer
+
+    # *************************************************************************************************
+    # Case B: Influence depth (H) extends into the second layer. Two-layer logic applies.
+    # *************************************************************************************************
+
+    # 1. Determine Case Type (Simplified soil classification based on parameters)
+    is_clay1 = fi1 < epsilon
+    is_clay2 = fi2 < epsilon
+    is_sand1 = c1 < epsilon
+    is_sand2 = c2 < epsilon
+
+    if is_clay1 and is_clay2:
+        case = CASE_CLAY_ON_CLAY
+    elif is_sand1 and is_clay2:
+        case = CASE_SAND_ON_CLAY
+    elif is_clay1 and is_sand2:
+        case = CASE_CLAY_ON_SAND
+    else:
+        case = CASE_C_PHI
+
+    # 2. Calculate the controlling ultimate capacity based on the case
+    # Divisions are exact (no "+ epsilon" bias): in this branch 0 < d1 < H and B, L > 0, 
+    # so only the cohesion ratio needs a guard against a zero denominator. The weighted 
+    # averages keep H + epsilon: fi_avg ~ epsilon for clays, where Nc is ill-conditioned
+
+    if case == CASE_CLAY_ON_CLAY:
+        # Clay on Clay (Based on Meyerhof/Bowles, uses corrected Nc, Ncs)
+        CR = _safe_divide(c2, c1, math.inf)
+        Ncs = 0.0
+
+        if CR < 0.7:
+            Ncs = (1.5 * d1 / B) + 5.14 * CR
+        elif 0.7 <= CR <= 1:
+            Ncs = 0.9 * ((1.5 * d1 / B) + 5.14 * CR)
+        elif CR > 1:
+            N1s = 4.14 + (0.5 * B / d1)
+            N2s = 4.14 + (1.1 * B / d1)
+            Ncs = 2 * ((N1s * N2s) / (N1s + N2s))
+
+        # Recalculate q_ult using Ncs instead of Nc
+        q_ult_bilayer = (c1 * Ncs * Sc * dc * ic) + (q_bar * Nq * Sq * dq * iq) + (0.5 * y_bar * B * Ny * Sy * dy * iy)
+
+    elif case == CASE_C_PHI:
+        # C-phi on C-phi (Uses Weighted Average Parameters)
+        fi_avg = (d1 * fi1 + (H - d1) * fi2) / (H + epsilon)
+        c_avg = (d1 * c1 + (H - d1) * c2) / (H + epsilon)
+
+        # Recalculate Bearing Factors using averaged parameters
+        _, kp_avg, Nq_avg, Nc_avg, Ny_avg, _ = _bearing_factors(fi_avg)
+
+        # Recalculate Shape/Depth/Inclination Factors (using fi_avg)
+
+        Sq_avg = 1 + 0.1 * kp_avg * B_L * (fi_avg > 10)
+        Sy_avg = Sq_avg
+        dq_avg = 1 + 0.1 * math.sqrt(kp_avg) * Df_B * (fi_avg > 10)
+        dy_avg = dq_avg
+        iy_avg = _inclination_factor_gamma(Theta, fi_avg)
+
+        # Calculate q_ult using averaged parameters
+        q_ult_bilayer = (c_avg * Nc_avg * Sc * dc * ic) + \
+                        (q_bar * Nq_avg * Sq_avg * dq_avg * iq) + \
+                        (0.5 * y_bar * B * Ny_avg * Sy_avg * dy_avg * iy_avg)
+
+    else:
+        # Sand on Clay or Clay on Sand (Punching Shear/Alternative Method)
+
+        # Ultimate Capacity assuming embedment in Layer 2 (q_ult_2)
+        kp2 = f2[1]
+        sqrt_kp2 = math.sqrt(kp2)
+
+        Nq2 = f2[2]
+        Nc2 = f2[3]
+        Ny2 = f2[4]
+
+        Sc2 = 1 + (0.2 * kp2 * B_L)
+        Sq2 = 1 + 0.1 * kp2 * B_L * (fi2 > 10)
+        Sy2 = Sq2
+        dc2 = 1 + 0.2 * sqrt_kp2 * Df_B
+        dq2 = 1 + 0.1 * sqrt_kp2 * Df_B * (fi2 > 10)
+        dy2 = dq2
+        ic2 = theta_term
+        iq2 = ic2
+        iy2 = _inclination_factor_gamma(Theta, fi2)
+
+        q_ult_2 = (c2 * Nc2 * Sc2 * dc2 * ic2) + (q_bar * Nq2 * Sq2 * dq2 * iq2) + (0.5 * y_bar * B * Ny2 * Sy2 * dy2 * iy2)
+
+        P = 2 * (B + L) # Perimeter
+        A_f = B * L # Area
+        pv = (Df * q_bar * d1) + (9.81 * ((d1 ** 2) / 2)) # Vertical pressure on the failure surface
+        ks = kp # Lateral earth pressure coefficient, using kp for stratum 1 (fi1)
+
+        # Calculate q_ult_prime (q_ult based on punching shear mechanism)
+        q_ult_prime = q_ult_2 + \
+                      ((P * pv * ks * f1[5]) / A_f) + \
+                      ((P * d1 * c1) / A_f)
+
+        # The controlling capacity is the minimum of q_ult_1 (single layer failure) and q_ult_prime (punching shear)
+        q_ult_bilayer = min(q_ult_1, q_ult_prime)
+
+    return q_ult_1, q_ult_bilayer
+
+"===================================================================="
+
+@njit(cache=True)
+def _meyerhof_batch(c1: np.ndarray, fi1: np.ndarray, f1: np.ndarray, c2: np.ndarray, fi2: np.ndarray, 
+                    f2: np.ndarray, q_bar: np.ndarray, y_bar: np.ndarray, d1: np.ndarray, Df: np.ndarray, 
+                    B: np.ndarray, L: np.ndarray, Theta: float, epsilon: float) -> tuple:
+    """
+    Applies _meyerhof_core to flat (1-D) arrays of footings in compiled code.
+
+    A plain compiled loop: the sweeps are a few hundred footings, far too small to 
+    repay the extra compile time of parallel=True/prange on a cold cache.
+
+    Args:
+        c1, fi1, c2, fi2, q_bar, y_bar, d1, Df, B, L (np.ndarray): Per-footing inputs
+            of _meyerhof_core, all of the same length n.
+        f1, f2 (np.ndarray): Precomputed stratum factors of layers 1 and 2, shape (n, 6).
+        Theta (float): Load inclination angle [degrees].
+        epsilon (float): Tolerance used to classify clays and sands (see _meyerhof_core).
+
+    Returns:
+        tuple: (q_ult_single_layer, q_ult_bilayer) as NumPy arrays [kPa].
+    """
+    n = Df.shape[0]
+    q_ult_1 = np.empty(n)
+    q_ult_bilayer = np.empty(n)
+
+    for i in range(n):
+        q_ult_1[i], q_ult_bilayer[i] = _meyerhof_core(
+            c1[i], fi1[i], f1[i], c2[i], fi2[i], f2[i], q_bar[i], y_bar[i], d1[i], Df[i], B[i], L[i], Theta, epsilon
+        )
+
+    return q_ult_1, q_ult_bilayer
+
+"===================================================================="
+
+@njit(cache=True)
+def _effective_overburden_core(strata: np.ndarray, Df: float, GWL: float, B: float, y_water: float) -> tuple:
+    """
+    Effective overburden pressure (q_bar) at foundation level and effective unit 
+    weight (gamma_bar) for one footing (see calculate_effective_overburden).
+
+    Args:
+        strata (np.ndarray): Stratum rows (Initial Depth, Final Depth, Unit Weight Moist, 
+            Unit Weight Saturated), shape (n_strata, 4), sorted by depth.
+        Df (float): Embedment depth [m].
+        GWL (float): Groundwater Level [m].
+        B (float): Footing width [m].
+        y_water (float): Unit weight of water [kN/m³].
+
+    Returns:
+        tuple: (q_bar [kN/m²], gamma_bar [kN/m³]).
+    """
+    q_bar = 0.0
+    
+    # Unit weights of the deepest stratum reached by Df (the first one if Df is above the profile)
+    y_stratum = strata[0, 2]
+    y_submerged = strata[0, 3] - y_water
+
+    for k in range(strata.shape[0]):
+        initial_depth, final_depth = strata[k, 0], strata[k, 1]
+        
+        # Portion of the stratum within the embedment depth (strata entirely below Df are ignored)
+        if final_depth <= Df:
+            stratum_thickness = final_depth - initial_depth
+        elif initial_depth <= Df <= final_depth:
+            stratum_thickness = Df - initial_depth
+        else:
+            continue
+
+        y_stratum = strata[k, 2]
+        y_submerged = strata[k, 3] - y_water
+
+        if GWL >= Df:
+            # GWL below the foundation level → moist unit weight
+            q_bar += stratum_thickness * y_stratum
+        elif GWL <= initial_depth:
+            # GWL above the stratum → submerged unit weight
+            q_bar += stratum_thickness * y_submerged
+        else:
+            # GWL within the stratum → moist and submerged fractions
+            h_moist = max(0.0, min(GWL - initial_depth, stratum_thickness))
+            h_submerged = max(0.0, stratum_thickness - h_moist)
+            q_bar += h_moist * y_stratum + h_submerged * y_submerged
+
+    # Effective unit weight for the capacity factors
+    if GWL < Df:
+        gamma_bar = y_submerged
+    elif (GWL - Df) < B:
+        gamma_bar = y_submerged + ((GWL - Df) / B) * (y_stratum - y_submerged)
+    else:
+        gamma_bar = y_stratum
+
+    return q_bar, gamma_bar
+
+"===================================================================="
+
+@njit(cache=True)
+def _effective_overburden_batch(strata: np.ndarray, Df: np.ndarray, GWL: float, B: np.ndarray, 
+                                y_water: float) -> tuple:
+    """
+    Applies _effective_overburden_core to flat (1-D) arrays of (Df, B) pairs 
+    in a plain compiled loop (serial, like _meyerhof_batch).
+
+    Args:
+        strata (np.ndarray): Stratum rows, shape (n_strata, 4) (see _effective_overburden_core).
+        Df, B (np.ndarray): Embedment depths and footing widths [m], of the same length n.
+        GWL (float): Groundwater Level [m].
+        y_water (float): Unit weight of water [kN/m³].
+
+    Returns:
+        tuple: (q_bar, gamma_bar) as NumPy arrays.
+    """
+    n = Df.shape[0]
+    q_bar = np.empty(n)
+    gamma_bar = np.empty(n)
+
+    for i in range(n):
+        q_bar[i], gamma_bar[i] = _effective_overburden_core(strata, Df[i], GWL, B[i], y_water)
+
+    return q_bar, gamma_bar
@@ -2,25 +2,31 @@
 # Standard Library Imports
 import os          # Handles file paths and the file system.
 import io          # For memory buffers (necessary for chart export function).
-import itertools   # Used in the original code.
+import math        # NaN detection when writing cells.
+import warnings    # Performance warning when lxml is not available.
 
 # External Library Imports
 import pandas as pd     # Essential for reading and manipulating DataFrames.
 import openpyxl         # For advanced Excel file manipulation.
-from openpyxl import load_workbook
-from openpyxl.styles import Alignment, Font, PatternFill, Border, Side
+from openpyxl import Workbook
+from openpyxl.styles import Alignment, Font, PatternFill, Border, Side, NamedStyle
+from openpyxl.styles.fonts import DEFAULT_FONT
+from openpyxl.styles.borders import DEFAULT_BORDER
 from openpyxl.utils import get_column_letter
+from openpyxl.cell import WriteOnlyCell
+from openpyxl.xml import LXML
 from openpyxl.drawing.image import Image
 
-# Visualization Libraries
-import matplotlib.pyplot as plt 
-import matplotlib.font_manager as font_manager
-from openpyxl import load_workbook, Workbook
-
 
 
 "==================================================================================================="
 
+# openpyxl parses and serializes XML with lxml when it is importable; without it, every 
+# load_workbook / save falls back to the much slower standard library parser
+if not LXML:
+    warnings.warn("lxml is not installed: Excel read/write will be substantially slower. "
+                  "Install it with 'pip install lxml'.", RuntimeWarning)
+
 # Constants and Default Values
 WATER_UNIT_WEIGHT = 9.81  # kN/m³ (Unit weight of water)
 OUTPUT_FILENAME = "Results_Bearing_Capacity"
@@ -29,6 +35,48 @@ SHEET_TITLE_1 = "Surface Bearing Capacity Results"
 SHEET_NAME_2 = "settlement_check"
 SHEET_TITLE_2 = "Settlement Check Results"
 OUTPUT_DIR = "output"
+CHART_DPI = 96  # Resolution of the chart PNGs embedded in the Excel report
+
+# Results sheet styles (immutable openpyxl styles, shared by every formatted cell)
+CENTER_ALIGN = Alignment(horizontal="center", vertical="center")
+THIN_BORDER = Border(
+    left=Side(style="thin"), right=Side(style="thin"),
+    top=Side(style="thin"), bottom=Side(style="thin")
+)
+TITLE_FONT = Font(size=14, bold=True, name="Arial Narrow")
+TITLE_FILL = PatternFill(start_color="FFBFBFBF", end_color="FFBFBFBF", fill_type="solid")
+HEADER_FONT = Font(bold=True, name="Arial Narrow")
+HEADER_FILL = PatternFill(start_color="FFF2F2F2", end_color="FFF2F2F2", fill_type="solid")
+
+# Names of the results named styles: each cell references a single style instead of 
+# getting its font/fill/border/alignment/number format assigned one by one
+TITLE_STYLE = "title_cell"
+HEADER_STYLE = "header_cell"
+DATA_STYLE = "data_cell"
+NUMBER_STYLE = "number_cell"
+
+"==================================================================================================="
+
+def _results_named_styles():
+    """
+    Builds fresh NamedStyle objects for the results sheets.
+
+    A NamedStyle is bound to the workbook it is added to, so each workbook gets its own 
+    instances instead of sharing module-level ones.
+
+    Returns:
+        tuple: The title, header, data and number NamedStyle objects.
+    """
+    # Unset font/border must be given explicitly as the workbook defaults
+    return (
+        NamedStyle(name=TITLE_STYLE, font=TITLE_FONT, fill=TITLE_FILL, 
+                   alignment=CENTER_ALIGN, border=DEFAULT_BORDER),
+        NamedStyle(name=HEADER_STYLE, font=HEADER_FONT, fill=HEADER_FILL, 
+                   alignment=CENTER_ALIGN, border=THIN_BORDER),
+        NamedStyle(name=DATA_STYLE, font=DEFAULT_FONT, alignment=CENTER_ALIGN, border=THIN_BORDER),
+        NamedStyle(name=NUMBER_STYLE, font=DEFAULT_FONT, alignment=CENTER_ALIGN, 
+                   border=THIN_BORDER, number_format="0.00"),
+    )
 
 "==================================================================================================="
 
@@ -39,13 +87,14 @@ def load_geotechnical_data(file_path: str = "Geotech_InputData.xlsx",
     Loads the main Excel file containing input data for shallow foundation design.
     
     Args:
-        file_path: Path to the input Excel file (default: "Geotech_InputData.xlsx").
+        file_path: Path to the input Excel file, a str or path-like object (default: "Geotech_InputData.xlsx").
         sheet_name_1: Name of the first sheet (Geotechnical data) to load (default: "geotechnical_input").
         sheet_name_2: Name of the second sheet (Footing configuration) to load (default: "footing_configuration").
     
     Returns:
         A tuple containing (workbook, sheet_1, sheet_2) if loading is successful, 
         or (None, None, None) if an error occurs (e.g., File not found, missing sheet).
+        The workbook is opened read-only; close it once all input data has been read.
     
     Example:
         >>> workbook, geo_sheet, config_sheet = load_geotechnical_data()
@@ -58,8 +107,22 @@ def load_geotechnical_data(file_path: str = "Geotech_InputData.xlsx",
     sheet_1 = None
     sheet_2 = None
 
+    # Accept str and path-like objects (e.g. pathlib.Path) alike
+    file_path = os.fspath(file_path)
+
+    # Fail fast on a wrong path or a format openpyxl cannot read (e.g. legacy .xls), 
+    # before entering the workbook parser
+    if not os.path.isfile(file_path):
+        print(f'❌ Error: File "{file_path}" not found. Check the path.')
+        return None, None, None
+    if not file_path.lower().endswith((".xlsx", ".xlsm", ".xltx", ".xltm")):
+        print(f'❌ Error: File "{file_path}" is not an .xlsx/.xlsm workbook.')
+        return None, None, None
+
     try:
-        workbook = openpyxl.load_workbook(file_path)
+        # Read-only streaming parse (cached values only, external links skipped): the input 
+        # is only read through iter_rows value sweeps
+        workbook = openpyxl.load_workbook(file_path, read_only=True, data_only=True, keep_links=False)
 
         # Load the first sheet (Geotechnical data)
         if sheet_name_1 in workbook.sheetnames:
@@ -67,6 +130,7 @@ def load_geotechnical_data(file_path: str = "Geotech_InputData.xlsx",
             print(f'✅ Sheet "{sheet_name_1}" loaded as sheet_1.')
         else:
             print(f'❌ Error: Sheet "{sheet_name_1}" not found in the file.')
+            workbook.close()  # A read-only workbook keeps the file open until closed
             return None, None, None
 
         # Load the second sheet (Configuration/Results)
@@ -75,6 +139,7 @@ def load_geotechnical_data(file_path: str = "Geotech_InputData.xlsx",
             print(f'✅ Sheet "{sheet_name_2}" loaded as sheet_2.')
         else:
             print(f'❌ Error: Sheet "{sheet_name_2}" not found in the file.')
+            workbook.close()  # A read-only workbook keeps the file open until closed
             return None, None, None
 
         print(f'✅ Excel file "{file_path}" loaded successfully.')
@@ -85,6 +150,8 @@ def load_geotechnical_data(file_path: str = "Geotech_InputData.xlsx",
         return None, None, None
     except Exception as e:
         print(f'⚠️ An error occurred while loading the file: {e}')
+        if workbook is not None:
+            workbook.close()
         return None, None, None
     
 "==================================================================================================="
@@ -107,10 +174,12 @@ def read_row_vector(sheet: openpyxl.worksheet.worksheet.Worksheet,
         A list containing the values read from the row.
     """
     vector = []
-    current_col = col_start
-    while sheet.cell(row=row, column=current_col).value is not None:
-        vector.append(sheet.cell(row=row, column=current_col).value)
-        current_col += 1
+    # Single pass over the row (random sheet.cell access re-parses the sheet in read-only mode)
+    for values in sheet.iter_rows(min_row=row, max_row=row, min_col=col_start, values_only=True):
+        for value in values:
+            if value is None:
+                break
+            vector.append(value)
     return vector
 
 "==================================================================================================="
@@ -135,14 +204,76 @@ def read_column_vector(sheet: openpyxl.worksheet.worksheet.Worksheet,
         A list containing the values read from the column.
     """
     vector_column = []
-    current_row = row
-    while sheet.cell(row=current_row, column=col_start).value is not None:
-        vector_column.append(sheet.cell(row=current_row, column=col_start).value)
-        current_row += 1
+    # Single pass down the column, stopping at the first empty cell
+    for (value,) in sheet.iter_rows(min_row=row, min_col=col_start, max_col=col_start, values_only=True):
+        if value is None:
+            break
+        vector_column.append(value)
     return vector_column
 
 "==================================================================================================="
 
+def write_formatted_sheet(ws, df, title):
+    """
+    Writes a DataFrame to a write-only worksheet with the results formatting applied 
+    as the cells are created, so the workbook is serialized only once.
+
+    Layout: title merged across row 1, column headers in row 3 and data from row 4. 
+    Headers and data cells get thin borders and centered alignment, and numeric values 
+    a 2-decimal format.
+
+    Args:
+        ws: A worksheet of an openpyxl Workbook(write_only=True), with no rows written yet.
+        df (pd.DataFrame): The DataFrame to write (without its index).
+        title (str): The title placed in cell A1.
+    """
+    # Register the results named styles in the workbook (once, shared by all its sheets)
+    wb = ws.parent
+    if TITLE_STYLE not in wb.named_styles:
+        for style in _results_named_styles():
+            wb.add_named_style(style)
+
+    # Column letters, computed once per sheet
+    letters = [get_column_letter(col_idx) for col_idx in range(1, len(df.columns) + 1)]
+    end_letter = letters[-1]
+
+    # Column widths must be set before any row is written in write-only mode
+    for letter in letters:
+        ws.column_dimensions[letter].width = 17
+
+    # Title (Row 1), merged across all columns (style on the top-left cell only)
+    title_cell = WriteOnlyCell(ws, value=title)
+    title_cell.style = TITLE_STYLE
+    ws.append([title_cell])
+    ws.merged_cells.add(f"A1:{end_letter}1")
+
+    # Row 2 is left empty
+    ws.append([])
+
+    # Headers in Row 3
+    header_row = []
+    for col_name in df.columns:
+        cell = WriteOnlyCell(ws, value=col_name)
+        cell.style = HEADER_STYLE
+        header_row.append(cell)
+    ws.append(header_row)
+
+    # Numeric columns (known from the dtypes, not checked cell by cell) get the 2-decimal format
+    numeric_columns = [pd.api.types.is_numeric_dtype(dtype) for dtype in df.dtypes]
+
+    # Data from Row 4: borders and alignment, plus the number format for numeric values
+    for values in df.itertuples(index=False, name=None):
+        data_row = []
+        for value, is_numeric in zip(values, numeric_columns):
+            if isinstance(value, float) and math.isnan(value):
+                value = None  # Missing values are left as empty cells
+            cell = WriteOnlyCell(ws, value=value)
+            cell.style = NUMBER_STYLE if is_numeric and value is not None else DATA_STYLE
+            data_row.append(cell)
+        ws.append(data_row)
+
+"==================================================================================================="
+
 def export_dataframe_to_excel(results, OUTPUT_DIR, file_name, header_title):
     """
     Exports a DataFrame to an Excel file with custom formatting applied.
@@ -161,63 +292,17 @@ def export_dataframe_to_excel(results, OUTPUT_DIR, file_name, header_title):
     # from openpyxl import load_workbook, ... 
     # import os, pandas as pd
 
-    if not os.path.exists(OUTPUT_DIR):
-        os.makedirs(OUTPUT_DIR)
+    os.makedirs(OUTPUT_DIR, exist_ok=True)
 
     excel_path = os.path.join(OUTPUT_DIR, f"{file_name}.xlsx")
 
     try:
-        # Save to Excel, shifting data to start from row 4, without DataFrame header
-        with pd.ExcelWriter(excel_path, engine='openpyxl') as writer:
-            results.to_excel(writer, index=False, startrow=3, header=False)
-
-        # Load the Excel file to apply custom formatting
-        wb = load_workbook(excel_path)
-        ws = wb.active
-
-        # Get the last column with data
-        last_column = ws.max_column
-        last_letter = get_column_letter(last_column)
-
-        # Apply title formatting (Row 1)
-        ws.merge_cells(f"A1:{last_letter}1")
-        ws["A1"] = header_title
-        ws["A1"].alignment = Alignment(horizontal="center", vertical="center")
-        ws["A1"].font = Font(size=14, bold=True, name="Arial Narrow")
-        ws["A1"].fill = PatternFill(start_color="BFBFBF", end_color="BFBFBF", fill_type="solid")
-
-        # Apply formatting to headers in Row 3
-        for col_idx, col_name in enumerate(results.columns, start=1):
-            column_letter = get_column_letter(col_idx)
-            cell = ws.cell(row=3, column=col_idx, value=col_name)
-            cell.font = Font(bold=True, name="Arial Narrow")
-            cell.alignment = Alignment(horizontal="center", vertical="center", wrap_text=True)
-            cell.fill = PatternFill(start_color="F2F2F2", end_color="F2F2F2", fill_type="solid")
-            ws.column_dimensions[column_letter].width = 17
-
-        # Define borders for cells
-        border = Border(
-            left=Side(style="thin"),
-            right=Side(style="thin"),
-            top=Side(style="thin"),
-            bottom=Side(style="thin")
-        )
-
-        # Apply borders and center alignment to all data cells
-        last_row = ws.max_row
-        for row in range(3, last_row + 1):
-            for col in range(1, last_column + 1):
-                cell = ws.cell(row=row, column=col)
-                cell.border = border
-                cell.alignment = Alignment(horizontal="center", vertical="center")
-
-        # Apply 2-decimal format to numeric values starting from Row 4
-        for row in ws.iter_rows(min_row=4, max_row=last_row, min_col=1, max_col=last_column):
-            for cell in row:
-                if isinstance(cell.value, (int, float)):
-                    cell.number_format = "0.00"
-
-        # Save changes to the workbook
+        # Build the formatted sheet in a single write-only pass (no write + reload round-trip)
+        wb = Workbook(write_only=True)
+        ws = wb.create_sheet("Sheet1")
+        write_formatted_sheet(ws, results, header_title)
+
+        # Save the workbook (serialized once)
         wb.save(excel_path)
         wb.close()
 
@@ -229,16 +314,22 @@ def export_dataframe_to_excel(results, OUTPUT_DIR, file_name, header_title):
 
 def export_charts_to_excel(figures_dict, output_dir, excel_filename):
     """
-    Exports a dictionary of Matplotlib figures to a NEW Excel file.
+    Exports Matplotlib figures to a NEW Excel file.
     Each figure is inserted into its own sheet.
 
     Args:
-        figures_dict (dict): A dictionary where keys are sheet names (str) 
-                             and values are Matplotlib Figure objects (plt.Figure).
+        figures_dict (dict or iterable): A dictionary, or an iterable of (key, value) pairs 
+                             such as the generator returned by generate_capacity_charts, 
+                             where keys are sheet names (str) and values are Matplotlib 
+                             Figure objects (plt.Figure) or charts already rendered as PNG (io.BytesIO).
         output_dir (str): The destination folder path (e.g., 'output').
         excel_filename (str): The name of the Excel file WITHOUT extension (e.g., 'Charts_bearing_capacity').
     """
-    # 0. Build the complete path with .xlsx extension
+    # pyplot is imported here, not at module level, so reading and table exports never load it
+    import matplotlib.pyplot as plt
+
+    # 0. Create the directory if it doesn't exist and build the complete path with .xlsx extension
+    os.makedirs(output_dir, exist_ok=True)
     excel_path = os.path.join(output_dir, f"{excel_filename}.xlsx")
 
     try:
@@ -250,16 +341,23 @@ def export_charts_to_excel(figures_dict, output_dir, excel_filename):
             default_sheet = workbook_excel["Sheet"]
             workbook_excel.remove(default_sheet)
 
-        # 3. Process each figure in the dictionary
-        for sheet_name, figure in figures_dict.items():
+        # 3. Process each figure (consumed one at a time if a generator is given)
+        figure_items = figures_dict.items() if isinstance(figures_dict, dict) else figures_dict
+        for sheet_name, figure in figure_items:
             # Create a new sheet for this chart
             excel_sheet = workbook_excel.create_sheet(sheet_name)
             
-            # Create an in-memory buffer and save the Matplotlib figure as PNG
-            buffer = io.BytesIO()
-            figure.savefig(buffer, format='png', bbox_inches='tight', dpi=150)
-            buffer.seek(0)
-            plt.close(figure)  # Close the Matplotlib figure to free resources
+            if isinstance(figure, io.BytesIO):
+                # Chart already rendered to PNG (generate_capacity_charts)
+                buffer = figure
+            else:
+                # Create an in-memory buffer and save the Matplotlib figure as PNG 
+                # (laid out once here instead of a bbox_inches='tight' measuring render)
+                figure.tight_layout(pad=0.3)
+                buffer = io.BytesIO()
+                figure.savefig(buffer, format='png', dpi=CHART_DPI)
+                buffer.seek(0)
+                plt.close(figure)  # Close the Matplotlib figure to free resources
             
             # Create an Openpyxl Image object and insert it into the sheet at A1
             img = Image(buffer)
@@ -271,7 +369,7 @@ def export_charts_to_excel(figures_dict, output_dir, excel_filename):
         # 4. Save the new workbook
         workbook_excel.save(excel_path)
         workbook_excel.close()
-        print(f"✅ Charts successfully exported to '{excel_path}'")
+        print(f"✅ {len(workbook_excel.sheetnames)} chart(s) successfully exported to '{excel_path}'")
 
     except Exception as e:
         print(f"❌ Error exporting Charts: '{e}'")
@@ -280,6 +378,45 @@ def export_charts_to_excel(figures_dict, output_dir, excel_filename):
         
 "==================================================================================================="
 
+def export_charts_to_png(figures_dict, output_dir):
+    """
+    Saves each chart as a standalone PNG file instead of embedding it in an Excel workbook 
+    (no workbook is built or serialized).
+
+    Args:
+        figures_dict (dict or iterable): Sheet/file names mapped to Matplotlib Figure objects or 
+                             charts already rendered as PNG (io.BytesIO), as in export_charts_to_excel.
+        output_dir (str): The destination folder path (e.g., 'output').
+    """
+    import matplotlib.pyplot as plt  # Lazy import, as in export_charts_to_excel
+
+    os.makedirs(output_dir, exist_ok=True)
+
+    try:
+        n_charts = 0
+        figure_items = figures_dict.items() if isinstance(figures_dict, dict) else figures_dict
+        for name, figure in figure_items:
+            png_path = os.path.join(output_dir, f"{name}.png")
+
+            if isinstance(figure, io.BytesIO):
+                # Already rendered: write the PNG bytes as they are
+                with open(png_path, "wb") as png_file:
+                    png_file.write(figure.getbuffer())
+            else:
+                figure.tight_layout(pad=0.3)
+                figure.savefig(png_path, format='png', dpi=CHART_DPI)
+                plt.close(figure)
+            n_charts += 1
+
+        print(f"✅ {n_charts} chart(s) successfully exported as PNG to '{output_dir}'")
+
+    except Exception as e:
+        print(f"❌ Error exporting Charts: '{e}'")
+        import traceback
+        traceback.print_exc()  # Print detailed error for debugging
+
+"==================================================================================================="
+
 def export_multiple_dataframes(df_1, df_2, output_dir, excel_filename, 
                                sheet_name_1, sheet_title_1, 
                                sheet_name_2, sheet_title_2):
@@ -299,62 +436,16 @@ def export_multiple_dataframes(df_1, df_2, output_dir, excel_filename,
     """
     
     # 1. Create the directory if it doesn't exist
-    if not os.path.exists(output_dir):
-        os.makedirs(output_dir)
+    os.makedirs(output_dir, exist_ok=True)
 
     # 2. Build the complete path with .xlsx extension
     excel_path = os.path.join(output_dir, f"{excel_filename}.xlsx")
 
     try:
-        # Write both DataFrames to their respective sheets
-        with pd.ExcelWriter(excel_path, engine='openpyxl') as writer:
-            df_1.to_excel(writer, sheet_name=sheet_name_1, startrow=3, index=False, header=False)
-            df_2.to_excel(writer, sheet_name=sheet_name_2, startrow=3, index=False, header=False)
-
-        # Load the workbook to apply formatting
-        wb = load_workbook(excel_path)
-
-        # Internal function to apply all formatting logic to a specific sheet
-        def apply_format(ws, df, title, sheet_name):
-            
-            last_column = ws.max_column
-            last_row = ws.max_row
-            end_letter = get_column_letter(last_column)
-
-            # Title (Row 1)
-            ws.merge_cells(f"A1:{end_letter}1")
-            ws["A1"] = title
-            ws["A1"].alignment = Alignment(horizontal="center", vertical="center")
-            ws["A1"].font = Font(size=14, bold=True, name="Arial Narrow")
-            ws["A1"].fill = PatternFill(start_color="BFBFBF", end_color="BFBFBF", fill_type="solid")
-
-            # Headers in Row 3
-            for i, col_name in enumerate(df.columns, start=1):
-                col_letter = get_column_letter(i)
-                cell = ws.cell(row=3, column=i, value=col_name)
-                cell.font = Font(bold=True, name="Arial Narrow")
-                cell.alignment = Alignment(horizontal="center", vertical="center", wrap_text=True)
-                cell.fill = PatternFill(start_color="F2F2F2", end_color="F2F2F2", fill_type="solid")
-                ws.column_dimensions[col_letter].width = 17
-
-            # Borders definition
-            border = Border(
-                left=Side(style="thin"), right=Side(style="thin"),
-                top=Side(style="thin"), bottom=Side(style="thin")
-            )
-
-            # Apply borders, alignment, and number format
-            for row in range(3, last_row + 1):
-                for col in range(1, last_column + 1):
-                    cell = ws.cell(row=row, column=col)
-                    cell.border = border
-                    cell.alignment = Alignment(horizontal="center", vertical="center")
-                    if isinstance(cell.value, (int, float)):
-                        cell.number_format = "0.00"
-
-        # Apply formatting to both sheets
-        apply_format(wb[sheet_name_1], df_1, sheet_title_1, sheet_name_1)
-        apply_format(wb[sheet_name_2], df_2, sheet_title_2, sheet_name_2)
+        # Write and format both DataFrames in a single write-only session
+        wb = Workbook(write_only=True)
+        write_formatted_sheet(wb.create_sheet(sheet_name_1), df_1, sheet_title_1)
+        write_formatted_sheet(wb.create_sheet(sheet_name_2), df_2, sheet_title_2)
 
         wb.save(excel_path)
         wb.close()
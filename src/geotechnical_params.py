@@ -3,14 +3,16 @@
 # External Library Imports
 import pandas as pd
 import numpy as np
-import math
-from itertools import product
+from itertools import takewhile
 import os
 import openpyxl # For type hinting the sheet argument
 
 # Internal Module Imports (Utility functions from data_io.py)
 # CORRECTED: Using the confirmed function names for data extraction
-from data_io import read_column_vector, read_row_vector 
+from data_io import read_row_vector 
+
+# Internal Module Imports (JIT-compiled bearing capacity factors)
+from capacity_core import _bearing_factors, _effective_overburden_core, _effective_overburden_batch
 
 # Note: The global variable WATER_UNIT_WEIGHT is defined here for calculation functions
 WATER_UNIT_WEIGHT = 9.81 # Default unit weight of water [kN/m³]
@@ -33,11 +35,10 @@ def get_stratum_id(df: pd.DataFrame, Df: float) -> str:
     if "Stratum ID" in df.columns:
         df = df.set_index("Stratum ID")
         
-    # Iterate over each stratum to find the one where Df falls
-    for stratum_id, row in df.iterrows():
-        # Check if Df is between the initial and final depths 
-        if row["Initial Depth"] <= Df < row["Final Depth"]:
-            return stratum_id  # Returns the found stratum ID
+    # Binary search for the stratum where Df falls (None if Df is outside the profile)
+    stratum_pos = find_stratum_position(df, Df)
+    if stratum_pos is not None:
+        return df.index[stratum_pos]  # Returns the found stratum ID
         
 "==================================================================================================="
 
@@ -53,15 +54,15 @@ def get_stratum_description(df: pd.DataFrame, Df: float) -> str:
     Returns:
         The description (str) of the stratum where the foundation base is located.
     """
-    # Ensure that the index is the "Stratum Description" column
-    if "Stratum Description" in df.columns:
-        df = df.set_index("Stratum Description")
+    # Binary search for the stratum where Df falls (None if Df is outside the profile)
+    stratum_pos = find_stratum_position(df, Df)
+    if stratum_pos is None:
+        return None
         
-    # Iterate over each stratum description to find the matching depth range
-    for stratum_description, row in df.iterrows():
-        # Check if Df is between the initial and final depths (Profundidad Inicial/Final)
-        if row["Initial Depth"] <= Df < row["Final Depth"]:
-            return stratum_description  # Returns the found stratum description
+    # The description is a column, or the index if the DataFrame is indexed by it
+    if "Stratum Description" in df.columns:
+        return df["Stratum Description"].iat[stratum_pos]  # Returns the found stratum description
+    return df.index[stratum_pos]
         
 "==================================================================================================="
 
@@ -79,17 +80,12 @@ def process_geotechnical_data(sheet_1: openpyxl.worksheet.worksheet.Worksheet, e
     """
     
     # ***********************************************************************************************************
-    # Geotechnical Property Vectors (Using read_raw_vector)
+    # Geotechnical Properties (columns B:I from row 13, one row per stratum)
     # ***********************************************************************************************************
     
-    stratum_ids = read_column_vector(sheet_1, row=13, col_start=2)
-    stratum_names = read_column_vector(sheet_1, row=13, col_start=3)
-    initial_depth = read_column_vector(sheet_1, row=13, col_start=4)
-    final_depth = read_column_vector(sheet_1, row=13, col_start=5)
-    unit_weight_moist = read_column_vector(sheet_1, row=13, col_start=6)
-    unit_weight_saturated = read_column_vector(sheet_1, row=13, col_start=7)
-    cohesion = read_column_vector(sheet_1, row=13, col_start=8)
-    friction_angle = read_column_vector(sheet_1, row=13, col_start=9)
+    # Single values-only sweep over the whole table, up to the first row without a Stratum ID
+    strata_rows = list(takewhile(lambda values: values[0] is not None, 
+                                 sheet_1.iter_rows(min_row=13, min_col=2, max_col=9, values_only=True)))
     
     # ***********************************************************************************************************
     # Creation of Vectors for Combinations (Df, B, L) (Using read_column_vector)
@@ -98,43 +94,44 @@ def process_geotechnical_data(sheet_1: openpyxl.worksheet.worksheet.Worksheet, e
     Df_values = read_row_vector(sheet_1, row=9, col_start=3)
     B_values = read_row_vector(sheet_1, row=10, col_start=3)
     
-    # Create the values for Length (L) to evaluate
-    scalars = [1, 1.25, 1.5, 2, 5, 10] 
-    L_values = [b * e for b, e in product(B_values, scalars)] 
-    L_values = sorted(set(L_values))
+    # Create the values for Length (L) to evaluate: every B times every scalar, 
+    # deduplicated and sorted in one vectorized step
+    scalars = np.array([1, 1.25, 1.5, 2, 5, 10])
+    L_values = np.unique(np.outer(np.asarray(B_values, dtype=np.float64), scalars)).tolist()
     
     # ***********************************************************************************************************
     # Input Parameters
     # ***********************************************************************************************************
     
-    code = sheet_1['C4'].value      
-    GWL = sheet_1['C5'].value       
-    beta = sheet_1['C6'].value      
-    theta = sheet_1['C7'].value     
+    # Title and parameters (C2:C7) read in a single values-only pass (no Cell objects, 
+    # and no per-cell re-parse of a read-only sheet)
+    parameters = [value for (value,) in sheet_1.iter_rows(min_row=2, max_row=7, min_col=3, max_col=3, 
+                                                          values_only=True)]
+    
+    code = parameters[2]    # C4
+    GWL = parameters[3]     # C5
+    beta = parameters[4]    # C6
+    theta = parameters[5]   # C7
     
     # Define Paths and Titles
-    output_dir = os.getcwd()
+    working_dir = os.getcwd() # Queried once, shared by the results and charts paths
+    output_dir = working_dir
     output_filename = "Results_Bearing_Capacity" 
-    header_title = sheet_1['C2'].value
-    chart_dir = os.getcwd()
+    header_title = parameters[0] # C2
+    chart_dir = working_dir
     chart_filename = "Charts_bearing_capacity.xlsx"
     
-    # Transformation of Cohesion and Friction Angle Vectors to avoid division by zero
-    cohesion_adj = [x + epsilon for x in cohesion]
-    friction_angle_adj = [x + epsilon for x in friction_angle]
+    # Create the DataFrame directly from the stratum rows
+    numeric_columns = ["Initial Depth", "Final Depth", "Unit Weight Moist", "Unit Weight Saturated", 
+                       "Cohesion", "Friction Angle"]
+    df = pd.DataFrame(strata_rows, columns=["Stratum ID", "Stratum Description"] + numeric_columns)
     
-    # Create the DataFrame
-    data = {
-        "Stratum ID": stratum_ids,
-        "Stratum Description": stratum_names,
-        "Initial Depth": initial_depth,
-        "Final Depth": final_depth,
-        "Unit Weight Moist": unit_weight_moist,
-        "Unit Weight Saturated": unit_weight_saturated,
-        "Cohesion": cohesion_adj,
-        "Friction Angle": friction_angle_adj
-    }
-    df = pd.DataFrame(data).set_index("Stratum ID")
+    # Pin the numeric properties to float64 (never int64/object, whatever the cell types)
+    df = df.astype(dict.fromkeys(numeric_columns, "float64")).set_index("Stratum ID")
+    
+    # Transformation of Cohesion and Friction Angle to avoid division by zero (vectorized)
+    df["Cohesion"] = df["Cohesion"] + epsilon
+    df["Friction Angle"] = df["Friction Angle"] + epsilon
     
     # Return all values in a dictionary
     return {
@@ -157,6 +154,29 @@ def process_geotechnical_data(sheet_1: openpyxl.worksheet.worksheet.Worksheet, e
 
 "==================================================================================================="
 
+def get_stratum_factors(df: pd.DataFrame) -> np.ndarray:
+    """
+    Bearing capacity factors that depend only on the friction angle of each stratum, 
+    computed from the current "Friction Angle" column (never stored in df, so they 
+    cannot go stale if the properties are edited).
+
+    Args:
+        df: DataFrame with geotechnical properties (indexed by Stratum ID).
+
+    Returns:
+        np.ndarray: Shape (n_strata, 6), one row per stratum with the factors in the order:
+        - Tan Alpha: tan(45 + phi/2), used for the influence depth H.
+        - Kp: Coefficient of passive earth pressure, tan²(45 + phi/2).
+        - Nq, Nc, Ny: Meyerhof bearing capacity factors.
+        - Tan Friction Angle: tan(phi).
+    """
+    # Same compiled routine used for averaged friction angles, so the values match bit for bit
+    factors = [_bearing_factors(fi) for fi in df["Friction Angle"].to_numpy(dtype=np.float64).tolist()]
+    
+    return np.array(factors, dtype=np.float64).reshape(len(factors), 6)
+
+"==================================================================================================="
+
 def load_footing_configuration(sheet_2: openpyxl.worksheet.worksheet.Worksheet) -> pd.DataFrame:
     """
     Creates a DataFrame with the configurations of footings to be analyzed 
@@ -174,29 +194,80 @@ def load_footing_configuration(sheet_2: openpyxl.worksheet.worksheet.Worksheet)
         - Design Load (kN): Applied vertical load in kilonewtons (Q).
     """
     
-    # Extract data from the Excel sheet using the corrected utility function
-    support_names = read_column_vector(sheet_2, row=3, col_start=2)
-    widths = read_column_vector(sheet_2, row=3, col_start=3)
-    lengths = read_column_vector(sheet_2, row=3, col_start=4)
-    embedments = read_column_vector(sheet_2, row=3, col_start=5)
-    loads = read_column_vector(sheet_2, row=3, col_start=6)
-    
-    # Create the DataFrame
-    df_footing_config = pd.DataFrame({
-        'Support Name': support_names,
-        'Footing Base (m)': widths,
-        'Footing Length (m)': lengths,
-        'Embedment Depth (m)': embedments,
-        'Design Load (kN)': loads
-    })
+    # Extract the configuration table (B3:F...) in a single values-only pass, 
+    # stopping at the first row without a support name
+    footing_rows = list(takewhile(lambda values: values[0] is not None, 
+                                  sheet_2.iter_rows(min_row=3, min_col=2, max_col=6, values_only=True)))
     
-    # Convert the load column to float type
-    df_footing_config['Design Load (kN)'] = df_footing_config['Design Load (kN)'].astype(float)
+    # Create the DataFrame with the dimensions and load pinned to float64 in one cast
+    numeric_columns = ['Footing Base (m)', 'Footing Length (m)', 'Embedment Depth (m)', 'Design Load (kN)']
+    df_footing_config = pd.DataFrame(footing_rows, columns=['Support Name'] + numeric_columns)
+    df_footing_config = df_footing_config.astype(dict.fromkeys(numeric_columns, "float64"))
     
     return df_footing_config
 
 "==================================================================================================="
 
+def get_stratum_positions(df: pd.DataFrame, Df) -> tuple:
+    """
+    Vectorized stratum lookup: returns the row positions of the stratum where the 
+    foundation base is placed and of the stratum immediately below it, for one or 
+    many embedment depths in a single np.searchsorted call.
+
+    Equivalent to get_stratum_id / get_stratum_parameters (Initial Depth <= Df < Final Depth) 
+    for strata sorted by depth.
+
+    Args:
+        df: DataFrame with geotechnical properties (indexed by Stratum ID).
+        Df: Embedment depth(s) [m], a scalar or an array.
+        
+    Returns:
+        A tuple containing (stratum_pos, lower_pos):
+        - stratum_pos: Row position(s) of the current stratum.
+        - lower_pos: Row position(s) of the stratum below (or the current one if it is the last stratum).
+
+    Raises:
+        ValueError: If any Df is above the profile, in a gap between strata, or at/below its bottom.
+    """
+    final_depths = df["Final Depth"].to_numpy(dtype=np.float64)
+    initial_depths = df["Initial Depth"].to_numpy(dtype=np.float64)
+    
+    stratum_pos = np.searchsorted(final_depths, Df, side="right")
+    
+    # Every Df must fall inside its stratum (below the last Final Depth and not above the Initial Depth)
+    in_profile = stratum_pos < len(df)
+    in_profile &= initial_depths[np.where(in_profile, stratum_pos, 0)] <= Df
+    if not np.all(in_profile):
+        Df_outside = np.ravel(Df)[~np.ravel(in_profile)][0]
+        raise ValueError(f"Embedment depth Df = {Df_outside} m is outside the stratigraphic profile.")
+    
+    lower_pos = np.minimum(stratum_pos + 1, len(df) - 1)
+    
+    return stratum_pos, lower_pos
+
+"==================================================================================================="
+
+def find_stratum_position(df: pd.DataFrame, Df: float):
+    """
+    Scalar stratum lookup by binary search: row position of the stratum that 
+    satisfies Initial Depth <= Df < Final Depth.
+
+    Args:
+        df: DataFrame with geotechnical properties, with strata sorted by depth.
+        Df: Embedment depth [m].
+        
+    Returns:
+        The row position (int) of the stratum, or None if Df is outside the profile.
+    """
+    try:
+        stratum_pos, _ = get_stratum_positions(df, Df)
+    except ValueError:
+        return None
+    
+    return int(stratum_pos)
+
+"==================================================================================================="
+
 def get_stratum_parameters(df: pd.DataFrame, Df: float) -> tuple:
     """
     Determines the geotechnical parameters (Cohesion and Friction Angle) 
@@ -213,29 +284,40 @@ def get_stratum_parameters(df: pd.DataFrame, Df: float) -> tuple:
         - c2: Cohesion of the stratum below (or c1 if it's the last stratum) [kN/m²].
         - phi2: Friction angle of the stratum below (or phi1 if it's the last stratum) [degrees].
     """
-    # 1. Determine the current stratum ID
-    current_stratum_id = get_stratum_id(df, Df)
+    # 1. Positions of the current stratum (Index 1) and of the stratum below (Index 2), 
+    #    which is the current one again if it is the last stratum
+    stratum_pos = find_stratum_position(df, Df)
+    if stratum_pos is None:
+        raise ValueError(f"Embedment depth Df = {Df} m is outside the stratigraphic profile.")
+    lower_pos = min(stratum_pos + 1, len(df) - 1)
     
-    # 2. Get parameters for the current stratum (Index 1)
-    c1 = df.loc[current_stratum_id, "Cohesion"]        # Retrieve Cohesion
-    phi1 = df.loc[current_stratum_id, "Friction Angle"] # Retrieve Friction Angle
-    
-    # 3. Check for the lower stratum (Index 2)
-    stratum_index = df.index.get_loc(current_stratum_id)  # Get the position of the index
-    
-    if stratum_index < len(df) - 1:  # Check if there is a stratum below
-        # Get parameters from the stratum below
-        c2 = df.iloc[stratum_index + 1]["Cohesion"]
-        phi2 = df.iloc[stratum_index + 1]["Friction Angle"]
-    else:
-        # If it's the last stratum, use the current stratum's parameters for the lower layer
-        c2 = c1
-        phi2 = phi1
+    # 2. Get parameters for both strata by position
+    c1 = df["Cohesion"].iat[stratum_pos]        # Retrieve Cohesion
+    phi1 = df["Friction Angle"].iat[stratum_pos] # Retrieve Friction Angle
+    c2 = df["Cohesion"].iat[lower_pos]
+    phi2 = df["Friction Angle"].iat[lower_pos]
     
     return c1, phi1, c2, phi2
 
 "==================================================================================================="
 
+def get_overburden_strata(df: pd.DataFrame) -> np.ndarray:
+    """
+    Stratum columns used by the effective overburden calculation, as a contiguous 
+    float64 array for the JIT-compiled kernels.
+
+    Args:
+        df: DataFrame with geotechnical properties.
+
+    Returns:
+        np.ndarray: Rows of (Initial Depth, Final Depth, Unit Weight Moist, Unit Weight Saturated).
+    """
+    return np.ascontiguousarray(
+        df[["Initial Depth", "Final Depth", "Unit Weight Moist", "Unit Weight Saturated"]].to_numpy(dtype=np.float64)
+    )
+
+"==================================================================================================="
+
 def calculate_effective_overburden(df: pd.DataFrame, Df: float, GWL: float, B: float) -> tuple:
     """
     Calculates the effective overburden pressure (q_bar) at the foundation level 
@@ -254,59 +336,37 @@ def calculate_effective_overburden(df: pd.DataFrame, Df: float, GWL: float, B: f
         - q_bar: Effective overburden pressure at foundation level [kN/m²].
         - gamma_bar: Effective unit weight for capacity factor calculations [kN/m³].
     """
-    q_bar = 0.0
-    # The 'peso_acumulado' variable in the original code is redundant for the final return
-    
-    # Standard unit weight of water
-    y_water = WATER_UNIT_WEIGHT  
-    
-    # Iterate through all strata to calculate q_bar
-    for _, row in df.iterrows():
-        # Determine the portion of the stratum within the embedment depth (Df)
-        if row["Final Depth"] <= Df:
-            stratum_thickness = row["Final Depth"] - row["Initial Depth"]
-        elif row["Initial Depth"] <= Df <= row["Final Depth"]:
-            stratum_thickness = Df - row["Initial Depth"]
-        else:
-            continue  # If the stratum is entirely below Df, ignore it
-
-        # Define unit weights
-        y_stratum = row["Unit Weight Moist"]
-        y_sat = row["Unit Weight Saturated"]
-        y_submerged = y_sat - y_water
-
-        # Calculate effective overburden based on the groundwater level (GWL)
-        if GWL >= Df:
-            # GWL is below the stratum depth → use moist unit weight
-            q_bar += stratum_thickness * y_stratum
-        elif GWL <= row["Initial Depth"]:
-            # GWL is above the stratum → use submerged unit weight
-            q_bar += stratum_thickness * y_submerged
-        else:
-            # GWL is within the stratum → consider both moist and submerged fractions
-            h_moist = GWL - row["Initial Depth"]
-            h_submerged = stratum_thickness - h_moist
-            
-            # Ensure h_moist does not exceed the stratum thickness above GWL
-            h_moist = max(0, min(h_moist, stratum_thickness))
-            h_submerged = max(0, stratum_thickness - h_moist)
-
-            q_bar += h_moist * y_stratum + h_submerged * y_submerged
-
-    # ***********************************************************************************************************
-    # Calculate Effective Unit Weight (gamma_bar) for Capacity Factors (Terzaghi/Meyerhof)
-    # ***********************************************************************************************************
-    
-    if GWL < Df:
-        # Case 1: GWL above Df, gamma_bar = submerged unit weight (simplified)
-        gamma_bar = y_submerged
-    elif (GWL - Df) < B:
-        # Case 2: GWL is between Df and Df + B
-        # Interpolation: R_w factor (R_w = 0.5 + 0.5 * (GWL - Df) / B)
-        # Simplified equivalent of R_w application to get gamma_bar:
-        gamma_bar = y_submerged + ((GWL - Df) / B) * (y_stratum - y_submerged)
-    else:
-        # Case 3: GWL is below Df + B → use moist unit weight
-        gamma_bar = y_stratum
+    # Numeric evaluation in the JIT-compiled core (stratum loop and GWL cases)
+    q_bar, gamma_bar = _effective_overburden_core(get_overburden_strata(df), float(Df), float(GWL), float(B), 
+                                                  WATER_UNIT_WEIGHT)
 
     return q_bar, gamma_bar
+
+"==================================================================================================="
+
+def calculate_effective_overburden_batch(df: pd.DataFrame, Df, GWL: float, B) -> tuple:
+    """
+    Vectorized version of calculate_effective_overburden: evaluates the effective 
+    overburden pressure (q_bar) and the effective unit weight (gamma_bar) for a whole 
+    batch of (Df, B) pairs in a single call to the JIT-compiled kernel.
+
+    Each pair runs the same core as the scalar function, so the results match it exactly.
+
+    Args:
+        df: DataFrame with geotechnical properties.
+        Df: Embedment depths [m], an array.
+        GWL: Groundwater Level (NAF) [m].
+        B: Footing widths [m], an array broadcastable with Df.
+
+    Returns:
+        A tuple containing (q_bar, gamma_bar), arrays of the same shape as Df:
+        - q_bar: Effective overburden pressure at foundation level [kN/m²].
+        - gamma_bar: Effective unit weight for capacity factor calculations [kN/m³].
+    """
+    Df, B = np.broadcast_arrays(np.asarray(Df, dtype=np.float64), np.asarray(B, dtype=np.float64))
+
+    # One JIT-compiled pass over the flattened pairs, reshaped back to the input shape
+    q_bar, gamma_bar = _effective_overburden_batch(get_overburden_strata(df), Df.ravel(), float(GWL), B.ravel(), 
+                                                   WATER_UNIT_WEIGHT)
+
+    return q_bar.reshape(Df.shape), gamma_bar.reshape(Df.shape)
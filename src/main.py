@@ -9,7 +9,8 @@ import os
 from data_io import (
     load_geotechnical_data,         
     export_multiple_dataframes,
-    export_charts_to_excel
+    export_charts_to_excel,
+    export_charts_to_png
 )
 
 # Imports geotechnical_params.py
@@ -30,10 +31,8 @@ from capacity_calc import (
     check_structural_design_capacity
 )
 
-# Imports plotting.py
-from plotting import (
-    generate_capacity_charts
-)
+# plotting.py (Matplotlib/seaborn) is imported lazily in section F, 
+# so runs that stop earlier never pay its import cost
 
 
 # =================================================================================
@@ -54,8 +53,12 @@ CHARTS_FILENAME = "Charts_bearing_capacity"    # Matplotlib plots
 
 # This ensures that the 'output' folder is created if it does not exist,
 # preventing the CI error when attempting to save results.
-if not os.path.exists(OUTPUT_DIR):
-    os.makedirs(OUTPUT_DIR)
+os.makedirs(OUTPUT_DIR, exist_ok=True)
+
+
+def _env_flag(name: str) -> bool:
+    """Returns True if the environment variable is set to 1/true/yes/on (case-insensitive)."""
+    return os.environ.get(name, "").strip().lower() in ("1", "true", "yes", "on")
     
 
 # =================================================================================
@@ -92,26 +95,33 @@ def run_geotechnical_analysis(input_excel_path: str):
     epsilon = geotech_data['epsilon']
 
     df_footing_config = load_footing_configuration(sheet_conf)
+
+    # All input data has been read: release the read-only workbook's file handle
+    workbook.close()
     
     # -----------------------------------------------------------------------------
     # C. CALL TO COMPLEMENTARY FUNCTIONS (Validation and Testing)
     # -----------------------------------------------------------------------------
     
-    # Definition of initial variables
-    Df_test = Df_values[0] if Df_values else epsilon
-    B_test = B_values[0] if B_values else epsilon
-    L_test = L_values[0] if L_values else epsilon
-    
-    print("\n--- Starting Validation Checks ---")
-    
-    # The following calls are for verification only
-    get_stratum_id(df_geotech, Df_test)
-    get_stratum_parameters(df_geotech, Df_test)
-    calculate_effective_overburden(df_geotech, Df_test, NAF, B_test)
-    meyerhof_capacity(df_geotech, Df_test, B_test, L_test, NAF, Teta, epsilon)
-    calculate_allowable_capacity(df_geotech, Df_test, B_test, L_test, NAF, Teta, epsilon, Norma)
-    
-    print("--- Validation Checks Completed ---")
+    # The checks repeat work done by the main calculations, so they only run on request
+    # (e.g. GEO_VALIDATE=1 python main.py)
+    if _env_flag("GEO_VALIDATE"):
+        # Definition of initial variables
+        Df_test = Df_values[0] if Df_values else epsilon
+        B_test = B_values[0] if B_values else epsilon
+        L_test = L_values[0] if L_values else epsilon
+        
+        print("\n--- Starting Validation Checks ---")
+        
+        # The following calls are for verification only
+        get_stratum_id(df_geotech, Df_test)
+        get_stratum_parameters(df_geotech, Df_test)
+        calculate_effective_overburden(df_geotech, Df_test, NAF, B_test)
+        q_ult_single_test, q_ult_bilayer_test = meyerhof_capacity(df_geotech, Df_test, B_test, L_test, NAF, Teta, epsilon)
+        calculate_allowable_capacity(df_geotech, Df_test, B_test, L_test, NAF, Teta, epsilon, Norma, 
+                                     q_ult_bilayer=q_ult_bilayer_test)
+        
+        print("--- Validation Checks Completed ---")
     
     # -----------------------------------------------------------------------------
     # D. MAIN CALCULATIONS
@@ -162,22 +172,31 @@ def run_geotechnical_analysis(input_excel_path: str):
     # F. CHARTS EXPORT TO SEPARATE FILE
     # -----------------------------------------------------------------------------
     
-    # 1. Generate Matplotlib figures
-    dictionary_of_figures = generate_capacity_charts(df_capacity_table)
-    print(f"✅ Generated {len(dictionary_of_figures)} chart(s).")
-
-    # 2. Export charts to Charts_bearing_capacity.xlsx (separate file)
-    export_charts_to_excel(
-        figures_dict=dictionary_of_figures, 
-        output_dir=OUTPUT_DIR, 
-        excel_filename=CHARTS_FILENAME  # Charts_bearing_capacity (without .xlsx)
-    )
-    print(f"📈 Charts exported to: {OUTPUT_DIR}/{CHARTS_FILENAME}.xlsx\n")
+    # 1. Capacity charts, generated lazily (rendered to in-memory PNG images)
+    from plotting import generate_capacity_charts
+    capacity_charts = generate_capacity_charts(df_capacity_table)
+
+    # 2. Export charts to Charts_bearing_capacity.xlsx (separate file), 
+    #    or as plain PNG files if CHARTS_AS_PNG is enabled (1/true/yes/on) (no Excel workbook is written)
+    charts_as_png = _env_flag("CHARTS_AS_PNG")
+    if charts_as_png:
+        export_charts_to_png(figures_dict=capacity_charts, output_dir=OUTPUT_DIR)
+        print(f"📈 Charts exported to: {OUTPUT_DIR}/Df_*.png\n")
+    else:
+        export_charts_to_excel(
+            figures_dict=capacity_charts, 
+            output_dir=OUTPUT_DIR, 
+            excel_filename=CHARTS_FILENAME  # Charts_bearing_capacity (without .xlsx)
+        )
+        print(f"📈 Charts exported to: {OUTPUT_DIR}/{CHARTS_FILENAME}.xlsx\n")
     
     print("✨ Workflow completed successfully. ✨")
     print(f"📁 Output files:")
     print(f"   1. {OUTPUT_DIR}/{RESULTS_FILENAME}.xlsx  (DataFrames)")
-    print(f"   2. {OUTPUT_DIR}/{CHARTS_FILENAME}.xlsx   (Charts)")
+    if charts_as_png:
+        print(f"   2. {OUTPUT_DIR}/Df_*.png   (Charts)")
+    else:
+        print(f"   2. {OUTPUT_DIR}/{CHARTS_FILENAME}.xlsx   (Charts)")
 
 
 # =================================================================================
@@ -1,103 +1,117 @@
 # External Library Imports
 import pandas as pd
+import matplotlib
+matplotlib.use("Agg")  # Charts are only rendered to PNG (no GUI backend needed)
 import matplotlib.pyplot as plt
-import matplotlib.font_manager as font_manager 
 import seaborn as sns
 import io 
+from typing import Iterator
 
-def generate_capacity_charts(results: pd.DataFrame) -> dict:
+# Internal Module Imports
+from data_io import CHART_DPI
+
+def generate_capacity_charts(results: pd.DataFrame) -> Iterator[tuple]:
     """
     Creates capacity charts (abacuses) showing Ultimate and Allowable Bearing 
     Capacity vs. B/L Ratio for different embedment depths (Df).
 
+    The input is validated immediately; the charts themselves are rendered lazily.
+
     Args:
         results (pd.DataFrame): DataFrame containing the capacity analysis results 
                                 (output from generate_capacity_table).
 
     Returns:
-        dict: A dictionary where keys are the Df values and the values are the 
-              corresponding Matplotlib Figure objects.
-    """
-    # Define color palette (can be defined globally in the file)
-    color_palette = ["black", "yellow", "green", "red", "magenta", "cyan", "blue", "orange"]
+        Iterator[tuple]: (sheet_name, png) pairs, one per Df, where sheet_name is "Df_<Df>m" and 
+               png is the chart rendered as an in-memory PNG image (io.BytesIO). Charts 
+               are produced as they are consumed, so only the current one is held in memory.
 
+    Raises:
+        ValueError: If the DataFrame lacks a required column.
+    """
     # Verify that the DataFrame contains the necessary columns
     required_columns = {"Embedment Depth (m)", "B/L Ratio", "Ultimate Capacity (kPa)",
                         "Allowable Capacity (kPa)", "Footing Base (m)", "Embedment Stratum ID"}
     if not required_columns.issubset(results.columns):
         raise ValueError("Missing required columns in the 'results' DataFrame.")
 
-    # Get list of unique embedment depths
-    depths = results["Embedment Depth (m)"].unique()
+    return _render_capacity_charts(results)
+
+"===================================================================="
+
+def _render_capacity_charts(results: pd.DataFrame) -> Iterator[tuple]:
+    """
+    Generator behind generate_capacity_charts: renders one chart per Df into a 
+    single reused figure and yields (sheet_name, png) pairs.
+
+    Args:
+        results (pd.DataFrame): Validated capacity results (see generate_capacity_charts).
+
+    Yields:
+        tuple: (sheet_name, png) for each embedment depth.
+    """
+    # Define color palette (can be defined globally in the file)
+    color_palette = ["black", "yellow", "green", "red", "magenta", "cyan", "blue", "orange"]
+
+    # Plotted metrics: column name -> chart name
+    metrics = {"Ultimate Capacity (kPa)": "Ultimate", "Allowable Capacity (kPa)": "Allowable"}
 
     # Configure font (assuming Montserrat is installed or handled elsewhere)
     # The font configuration block is left out for simplicity, assuming a standard setup.
     
-    # Dictionary to store the figures
-    figures = {}
-
-    # Create individual charts for each embedment depth
-    for Df in depths:
-        df_filter = results[results["Embedment Depth (m)"] == Df]
-        stratum = df_filter["Embedment Stratum ID"].iloc[0]  # Get the corresponding stratum ID
-
-        # Get min/max values to adjust Y-axes dynamically
-        min_qult = df_filter["Ultimate Capacity (kPa)"].min()
-        max_qult = df_filter["Ultimate Capacity (kPa)"].max()
-        min_qadm = df_filter["Allowable Capacity (kPa)"].min()
-        max_qadm = df_filter["Allowable Capacity (kPa)"].max()
-
-        # Apply a 10% margin for better visualization
-        margin_qult = (max_qult - min_qult) * 0.10
-        margin_qadm = (max_qadm - min_qadm) * 0.10
-
-        # Create figure and subplots
-        fig, axes = plt.subplots(1, 2, figsize=(14, 6))
-
-        # Filter B/L Ratio to standard range
-        df_filter = df_filter[(df_filter["B/L Ratio"] >= 0.1) & (df_filter["B/L Ratio"] <= 1)]
-
-        # --- Ultimate Capacity Chart ---
-        sns.lineplot(
-            x="B/L Ratio",
-            y="Ultimate Capacity (kPa)",
-            hue="Footing Base (m)", 
-            data=df_filter,
-            ax=axes[0],
-            palette=color_palette[:df_filter["Footing Base (m)"].nunique()],
-            style="Footing Base (m)",
-            dashes=[(2, 2)] * df_filter["Footing Base (m)"].nunique(),
-            markers=True,
-            errorbar=None
-        )
-        axes[0].set_title(f"Ultimate Bearing Capacity for Df= {Df:.2f} m - {stratum}",
-                          fontsize=14, fontweight='bold')
-        axes[0].set_xlabel("B/L Ratio", fontweight='bold')
-        axes[0].set_ylabel("Ultimate Bearing Capacity (kPa)", fontweight='bold')
-        axes[0].set_ylim(min_qult - margin_qult, max_qult + margin_qult)
-        axes[0].grid(color='#D3D3D3', linestyle="--", linewidth=0.7)
-
-        # --- Allowable Capacity Chart ---
-        sns.lineplot(
-            x="B/L Ratio",
-            y="Allowable Capacity (kPa)",
-            hue="Footing Base (m)",  
-            data=df_filter,
-            ax=axes[1],
-            palette=color_palette[:df_filter["Footing Base (m)"].nunique()],
-            style="Footing Base (m)",
-            dashes=[(2, 2)] * df_filter["Footing Base (m)"].nunique(),
-            markers=True,
-            errorbar=None
-        )
-        axes[1].set_title(f"Allowable Bearing Capacity for Df= {Df:.2f} m - {stratum}",
-                          fontsize=14, fontweight='bold')
-        axes[1].set_xlabel("B/L Ratio", fontweight='bold')
-        axes[1].set_ylabel("Allowable Bearing Capacity (kPa)", fontweight='bold')
-        axes[1].set_ylim(min_qadm - margin_qadm, max_qadm + margin_qadm)
-        axes[1].grid(color='#D3D3D3', linestyle="--", linewidth=0.7)
-
-        plt.tight_layout()
-        figures[f"Df_{Df:.2f}m"] = fig # Store the figure in the dictionary
-
-    return figures # Returns a dictionary of figures
\ No newline at end of file
+    # Per-Df summaries computed once with groupby:
+    # the stratum ID and the min/max of each metric (over all B/L) to adjust Y-axes dynamically
+    by_depth = results.groupby("Embedment Depth (m)")
+    strata = by_depth["Embedment Stratum ID"].first()
+    limits = by_depth[list(metrics)].agg(["min", "max"])
+
+    # Filter B/L Ratio to standard range
+    in_range = results[(results["B/L Ratio"] >= 0.1) & (results["B/L Ratio"] <= 1)]
+
+    # A single figure is reused for every depth (the axes are cleared and re-plotted), 
+    # and each chart is rendered to an in-memory PNG, so no Figure is kept alive per Df
+    fig, axes = plt.subplots(1, 2, figsize=(14, 6))
+
+    try:
+        # Create individual charts for each embedment depth (groups in order of appearance)
+        for Df, df_filter in in_range.groupby("Embedment Depth (m)", sort=False):
+            stratum = strata[Df]  # Get the corresponding stratum ID
+            n_bases = df_filter["Footing Base (m)"].nunique()
+
+            # --- Ultimate and Allowable Capacity Charts ---
+            for ax, (metric, name) in zip(axes, metrics.items()):
+                ax.clear()
+                sns.lineplot(
+                    x="B/L Ratio",
+                    y=metric,
+                    hue="Footing Base (m)", 
+                    data=df_filter,
+                    ax=ax,
+                    palette=color_palette[:n_bases],
+                    style="Footing Base (m)",
+                    dashes=[(2, 2)] * n_bases,
+                    markers=True,
+                    errorbar=None
+                )
+
+                # Apply a 10% margin for better visualization
+                min_q, max_q = limits.loc[Df, (metric, "min")], limits.loc[Df, (metric, "max")]
+                margin = (max_q - min_q) * 0.10
+
+                ax.set_title(f"{name} Bearing Capacity for Df= {Df:.2f} m - {stratum}",
+                             fontsize=14, fontweight='bold')
+                ax.set_xlabel("B/L Ratio", fontweight='bold')
+                ax.set_ylabel(f"{name} Bearing Capacity (kPa)", fontweight='bold')
+                ax.set_ylim(min_q - margin, max_q + margin)
+                ax.grid(color='#D3D3D3', linestyle="--", linewidth=0.7)
+
+            fig.tight_layout()
+
+            # Render the current state of the figure to PNG before it is re-plotted 
+            # (the layout is already final, so no bbox_inches='tight' second render pass)
+            buffer = io.BytesIO()
+            fig.savefig(buffer, format='png', dpi=CHART_DPI)
+            buffer.seek(0)
+            yield f"Df_{Df:.2f}m", buffer # Hand the PNG image to the caller
+    finally:
+        plt.close(fig)  # Close the shared figure, also if the caller stops early or an error occurs
@@ -0,0 +1,142 @@
+# =================================================================================
+# SMOKE TEST: bundled input workbook -> capacity table and footing check
+# =================================================================================
+
+import os
+import sys
+
+import pytest
+
+REPO_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(REPO_DIR, "src"))
+
+from data_io import load_geotechnical_data
+from geotechnical_params import (
+    process_geotechnical_data,
+    load_footing_configuration,
+    get_stratum_id,
+    get_stratum_parameters,
+    get_stratum_positions,
+    calculate_effective_overburden
+)
+from capacity_calc import (
+    meyerhof_capacity,
+    calculate_allowable_capacity,
+    generate_capacity_table,
+    check_structural_design_capacity
+)
+
+INPUT_PATH = os.path.join(REPO_DIR, "data", "Geotech_InputData.xlsx")
+
+
+"==================================================================================================="
+
+@pytest.fixture(scope="module")
+def analysis_inputs():
+    """Loads and processes the bundled input workbook once for all tests."""
+    workbook, sheet_geo, sheet_conf = load_geotechnical_data(INPUT_PATH)
+    assert workbook is not None
+    geotech_data = process_geotechnical_data(sheet_geo)
+    df_footing_config = load_footing_configuration(sheet_conf)
+    workbook.close()
+    return geotech_data, df_footing_config
+
+
+"==================================================================================================="
+
+def test_stratum_lookup(analysis_inputs):
+    geotech_data, _ = analysis_inputs
+    df_geotech = geotech_data['df']
+
+    # Df = 1.0 m lies in Stratum 2 (0.5-2.0 m, sand) above Stratum 3 (2.0-6.0 m, soft clay)
+    assert get_stratum_id(df_geotech, 1.0) == 'Stratum 2'
+    assert get_stratum_parameters(df_geotech, 1.0) == pytest.approx((0.0, 28.0, 55.0, 0.0), abs=1e-9)
+
+    positions, next_positions = get_stratum_positions(df_geotech, [1.0, 1.2, 2.0])
+    assert positions.tolist() == [1, 1, 2]
+    assert next_positions.tolist() == [2, 2, 3]
+
+    with pytest.raises(ValueError, match="outside the stratigraphic profile"):
+        get_stratum_parameters(df_geotech, 100.0)
+
+
+"==================================================================================================="
+
+@pytest.mark.parametrize("Df", [-1.0, 100.0, [1.0, 100.0]])
+def test_stratum_positions_outside_profile(analysis_inputs, Df):
+    geotech_data, _ = analysis_inputs
+
+    # The profile spans 0-25 m: same error as get_stratum_parameters
+    with pytest.raises(ValueError, match="outside the stratigraphic profile"):
+        get_stratum_positions(geotech_data['df'], Df)
+
+
+"==================================================================================================="
+
+def test_effective_overburden(analysis_inputs):
+    geotech_data, _ = analysis_inputs
+    q_bar = calculate_effective_overburden(geotech_data['df'], 1.0, geotech_data['GWL'], 1.0)
+
+    assert q_bar == pytest.approx((20.0, 20.0), rel=1e-9)
+
+
+"==================================================================================================="
+
+def test_capacity_table(analysis_inputs):
+    geotech_data, _ = analysis_inputs
+    table = generate_capacity_table(
+        geotech_data['df'], geotech_data['Df_values'], geotech_data['B_values'],
+        geotech_data['L_values'], geotech_data['GWL'], geotech_data['Theta'],
+        geotech_data['epsilon'], geotech_data['code']
+    )
+
+    assert len(table) == 177
+
+    # First rows: Df = 1.0 m, B = 1.0 m, L = 1.0 / 1.25 / 1.5 m (Stratum 2, Calcareus Sand)
+    first = table.iloc[0]
+    assert first['Embedment Stratum ID'] == 'Stratum 2'
+    assert table['Footing Length (m)'].iloc[:3].tolist() == [1.0, 1.25, 1.5]
+    assert table['Ultimate Capacity (kPa)'].iloc[:3].tolist() == pytest.approx(
+        [605.1786001842911, 578.9254701256051, 561.4233834198144], rel=1e-9)
+    assert first['Allowable Capacity (kPa)'] == pytest.approx(201.72620006143038, rel=1e-9)
+
+
+"==================================================================================================="
+
+def test_single_footing_matches_table(analysis_inputs):
+    geotech_data, _ = analysis_inputs
+    q_ult_single, q_ult_bilayer = meyerhof_capacity(
+        geotech_data['df'], 1.0, 1.0, 1.0, geotech_data['GWL'],
+        geotech_data['Theta'], geotech_data['epsilon']
+    )
+
+    assert q_ult_single == pytest.approx(605.1786001842911, rel=1e-9)
+    assert q_ult_bilayer == pytest.approx(605.1786001842911, rel=1e-9)
+
+    # Factor of safety 3.0 (Bowles), with and without the precomputed bilayer capacity
+    expected = pytest.approx((605.1786001842911, 201.72620006143038), rel=1e-9)
+    allowable_args = (geotech_data['df'], 1.0, 1.0, 1.0, geotech_data['GWL'], geotech_data['Theta'],
+                      geotech_data['epsilon'], geotech_data['code'])
+    assert calculate_allowable_capacity(*allowable_args) == expected
+    assert calculate_allowable_capacity(*allowable_args, q_ult_bilayer=q_ult_bilayer) == expected
+
+
+"==================================================================================================="
+
+def test_footing_check(analysis_inputs):
+    geotech_data, df_footing_config = analysis_inputs
+    results = check_structural_design_capacity(
+        df_footing_config, geotech_data['df'], geotech_data['GWL'],
+        geotech_data['Theta'], geotech_data['epsilon'], geotech_data['code']
+    )
+
+    assert results['Support Name'].tolist() == [f"Footing {i}" for i in range(1, 10)]
+    assert results['Ultimate Capacity (kPa)'].tolist() == pytest.approx([
+        301.0238740448184, 509.52403283218507, 569.449038173924,
+        607.222886967277, 579.9703685904086, 417.0582106611674,
+        479.6433419468939, 536.6046424671041, 764.6648893135592
+    ], rel=1e-9)
+    assert results['Bearing Capacity Check'].tolist() == ['❌', '❌', '✅', '✅', '✅', '✅', '❌', '❌', '❌']
+
+    # The input configuration is not modified
+    assert 'Ultimate Capacity (kPa)' not in df_footing_config.columns